@@ -1,9 +1,38 @@
-import json
 from datetime import datetime
-from reportlab.pdfgen import canvas
-from reportlab.lib.pagesizes import letter
-from reportlab.lib.units import inch
-from wipe_certificates.main import richa
+from concurrent.futures import ProcessPoolExecutor
+from wipe_certificates.paths import report_paths
+
+_EMPTY = {}  # Shared read-only default for missing nested sections
+
+
+def _text(value):
+    """Normalizes a report value to display text; None becomes an empty string."""
+    if value is None:
+        return ""
+    return value if isinstance(value, str) else str(value)
+
+# Validation is not performed in this version, so the section is constant.
+_VALIDATION_PLACEHOLDER = {
+    "validatorName": "-",
+    "validatorTitle": "-",
+    "validatorOrganization": "-",
+    "validatorLocation": "-",
+    "validatorPhone": "-",
+    "validationDate": "-",
+}
+
+
+def _generate_one(args):
+    """
+    Process-pool worker: rebuilds a generator from plain data and renders it.
+    Returns (certificate_id, error) where error is None on success.
+    """
+    try:
+        CertificateGenerator(*args).generate_pdf()
+    except Exception as e:
+        return args[-1], f"{type(e).__name__}: {e}"
+    return args[-1], None
+
 
 class CertificateGenerator:
     """Generates PDF and JSON certificates of sanitization."""
@@ -15,58 +44,100 @@ class CertificateGenerator:
         self.wipe_report = wipe_report
         self.certificate_id = certificate_id
         self.timestamp = datetime.utcnow()
+        self._data = None
+        self.json_path, self.pdf_path = report_paths(certificate_id)
+
+    def _data_dict(self):
+        """Returns the certificate dictionary, building it on first use."""
+        if self._data is None:
+            self._data = self._create_data_dict()
+        return self._data
 
     def _create_data_dict(self):
         """Creates a comprehensive dictionary for the certificate."""
+        u = self.user_data
+        sd = self.system_data.get("system_details") or _EMPTY
 
         return {
         "personPerformingSanitization": {
-            "name": self.user_data.get("name"),
-            "title": self.user_data.get("title"),
-            "organization": self.user_data.get("organization"),
-            "location": self.user_data.get("location"),
-            "phone": self.user_data.get("phone"),
+            "name": _text(u.get("name")),
+            "title": _text(u.get("title")),
+            "organization": _text(u.get("organization")),
+            "location": _text(u.get("location")),
+            "phone": _text(u.get("phone")),
         },
         
         "mediaInformation": {
-            "makeVendor": self.system_data.get("system_details", {}).get("vendor"),
-            "modelNumber": self.system_data.get("system_details", {}).get("model"),
-            "serialNumber": ' '.join([dev.get("serial", "N/A") for dev in self.wiped_devices]),
-            "mediaPropertyNumber": self.user_data.get("media_property_number"),
+            "makeVendor": _text(sd.get("vendor")),
+            "modelNumber": _text(sd.get("model")),
+            "serialNumber": ' '.join(_text(dev.get("serial")) or "N/A" for dev in self.wiped_devices),
+            "mediaPropertyNumber": _text(u.get("media_property_number")),
             "mediaType": "-",
-            "source": self.user_data.get("source"),
+            "source": _text(u.get("source")),
             "classification": "Not Applicable",
-            "dataBackedUp": str(bool(self.user_data.get("backup_location"))),
-            "backupLocation": self.user_data.get("backup_location"),
+            "dataBackedUp": str(bool(u.get("backup_location"))),
+            "backupLocation": _text(u.get("backup_location")),
         },
         
         "sanitizationDetails": {
-            "methodType": "Purge",
-            "methodUsed": self.wipe_report.get("method_used"),
+            "methodType": self._method_type(),
+            "methodUsed": ", ".join(dict.fromkeys((self.wipe_report.get("methods_used") or _EMPTY).values())) or "-",
             "methodDetails": "-",
             "toolUsed": "Secure Data Wiper v1.0",
             "verificationMethod": "Not performed in this version",
             "postSanitizationClassification": "Unclassified",
-            "notes": self.user_data.get("notes"),
+            "notes": _text(u.get("notes")),
         },
         
         "mediaDestination": {
             "destination": "-",
-            "details": self.user_data.get("destination"),
+            "details": _text(u.get("destination")),
         },
         
-        "validation": {
-            "validatorName": "-",
-            "validatorTitle": "-",
-            "validatorOrganization": "-",
-            "validatorLocation": "-",
-            "validatorPhone": "-",
-            "validationDate": "-"
-        }
+        "validation": dict(_VALIDATION_PLACEHOLDER),
     }
 
+    def _method_type(self):
+        """
+        The NIST SP 800-88 category of the weakest method used: 'Purge' only
+        if every device was purged, otherwise 'Clear'.
+        """
+        types = set((self.wipe_report.get("method_types") or _EMPTY).values())
+        if not types:
+            return "-"
+        return "Purge" if types == {"Purge"} else "Clear"
+
     def generate_pdf(self):
         """Generates a PDF certificate file using ReportLab."""
-        data = self._create_data_dict()
-        richa(data, self.certificate_id)
-        
\ No newline at end of file
+        # The report pipeline (ReportLab, pyHanko, dotenv) is imported only
+        # here, so building a generator on the GUI thread stays cheap.
+        from wipe_certificates.main import richa
+        richa(self._data_dict(), self.certificate_id, self.json_path, self.pdf_path)
+
+    def generate_png(self, filename=None):
+        """
+        Renders the certificate as an unsigned single-page PNG, skipping the
+        ReportLab/signing pipeline. Useful when only a viewable archival image
+        is needed. Returns the written filename.
+        """
+        from wipe_certificates.png_generator import generate_png
+        filename = filename or f"sanitization_report_{self.certificate_id}.png"
+        data = dict(self._data_dict(), report_uuid=self.certificate_id)
+        generate_png(data, filename)
+        return filename
+
+    @classmethod
+    def generate_batch(cls, arg_tuples, workers=None):
+        """
+        Generates certificates for many wipes in parallel worker processes.
+        Each item is a (user_data, system_data, wiped_devices, wipe_report,
+        certificate_id) tuple of plain, picklable data.
+        Returns (certificate_id, error) pairs in input order; error is None
+        for certificates that were generated and signed.
+        """
+        # Create the signing certificate once here; workers racing to create
+        # it would each write a different key.
+        from wipe_certificates.main import ensure_p12
+        ensure_p12()
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_generate_one, arg_tuples))
@@ -1,9 +1,10 @@
 import sys
 import os
 import uuid
+import platform
 from PySide6.QtWidgets import QApplication, QMainWindow, QStackedWidget, QListWidgetItem, QMessageBox
 from PySide6.QtUiTools import QUiLoader
-from PySide6.QtCore import QFile, QIODevice, Qt
+from PySide6.QtCore import QBuffer, QByteArray, QIODevice, Qt, QObject, QRunnable, QThreadPool, QTimer, Signal, Slot
 
 # Import logic modules
 from system_info import SystemInfo
@@ -22,44 +23,116 @@ os.makedirs(JSON_FOLDER, exist_ok=True)
 os.makedirs(PDF_FOLDER, exist_ok=True)
 
 
+class SystemInfoSignals(QObject):
+    """Signals for SystemInfoWorker (QRunnable is not a QObject)."""
+    finished = Signal(dict)
 
 
+class SystemInfoWorker(QRunnable):
+    """Collects system and device information on a thread-pool thread."""
+
+    def __init__(self, system_info_handler):
+        super().__init__()
+        self.system_info_handler = system_info_handler
+        self.signals = SystemInfoSignals()
+
+    def run(self):
+        # Always emit, so the device page never stays stuck on "Refreshing"
+        system_data = {}
+        try:
+            system_data = self.system_info_handler.get_all_info()
+        except Exception as e:
+            print(f"Could not collect system information: {e}")
+        finally:
+            self.signals.finished.emit(system_data)
+
+
+class CertificateSignals(QObject):
+    """Signals for CertificateWorker; finished carries an error message or ''."""
+    finished = Signal(str)
+
+
+class CertificateWorker(QRunnable):
+    """Writes the JSON report, builds the PDF and signs it on a pool thread."""
+
+    def __init__(self, cert_generator):
+        super().__init__()
+        self.cert_generator = cert_generator
+        self.signals = CertificateSignals()
+
+    def run(self):
+        try:
+            self.cert_generator.generate_pdf()
+            # richa() raises on signing failures; also refuse to report
+            # success if the signed PDF is somehow missing
+            if not os.path.exists(self.cert_generator.pdf_path):
+                raise RuntimeError(f"Signed PDF was not written: {self.cert_generator.pdf_path}")
+        except Exception as e:
+            self.signals.finished.emit(str(e))
+        else:
+            self.signals.finished.emit("")
+
 
 class MainWindow(QMainWindow):
     """Main application window to manage the UI and application flow."""
 
+    # (user_data key, line edit objectName) for every field on the info input page
+    INFO_FIELDS = (
+        ("name", "Name_lineEdit"),
+        ("organization", "OrganizationlineEdit"),
+        ("title", "Title_lineEdit"),
+        ("location", "Location_lineEdit"),
+        ("email", "Email_lineEdit"),
+        ("phone", "Phone_lineEdit"),
+        ("media_property_number", "AssetTag_lineEdit"),
+        ("source", "Source_lineEdit"),
+        ("backup_location", "Backup_lineEdit"),
+        ("notes", "Notes_lineEdit"),
+        ("destination", "Destination_lineEdit"),
+    )
+    # Fields that must be filled before 'Continue' is enabled
+    REQUIRED_INFO_FIELDS = ("Name_lineEdit", "OrganizationlineEdit", "AssetTag_lineEdit")
+
     def __init__(self):
         super().__init__()
         self.ui_files_dir = "ui_files"
+        self._ui_loader = QUiLoader()  # one loader (and widget factory) for all pages
         self.user_data = {}
         self.system_data = {}
+        self._system_info_worker = None  # in-flight device scan, if any
         self.certificate_id = None
+        self._last_progress = -1  # last value applied to the loading progress bar
+        self._pending_progress = None
+        # Progress signals are coalesced into at most one repaint per 50 ms
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(50)
+        self._progress_timer.timeout.connect(self._flush_loading_progress)
+        self._download_msg = None
 
         # Set up the stacked widget to hold all the pages
         self.stacked_widget = QStackedWidget()
         self.setCentralWidget(self.stacked_widget)
         self.setMinimumSize(850, 600)
 
-        # Load all UI pages
-        self.pages = {
-            "home": self.load_ui("homepage.ui"),
-            "info_input": self.load_ui("info_input_page.ui"),
-            "system_info": self.load_ui("system_info_page.ui"),
-            "loading": self.load_ui("loading_page.ui"),
-            "report": self.load_ui("report_page.ui"),
-            "unsuccessful": self.load_ui("unsucessful.ui"),
+        # UI pages are loaded lazily on first navigation; only the homepage
+        # is parsed at start-up.
+        self._page_files = {
+            "home": "homepage.ui",
+            "info_input": "info_input_page.ui",
+            "system_info": "system_info_page.ui",
+            "loading": "loading_page.ui",
+            "report": "report_page.ui",
+            "unsuccessful": "unsucessful.ui",
         }
-
-        # Add pages to the stacked widget
-        for page_widget in self.pages.values():
-            self.stacked_widget.addWidget(page_widget)
-
-        # Setup connections for each page
-        self._setup_home_page()
-        self._setup_info_input_page()
-        self._setup_system_info_page()
-        self._setup_report_page()
-        self._setup_unsuccessful_page()
+        self._page_setup = {
+            "home": self._setup_home_page,
+            "info_input": self._setup_info_input_page,
+            "system_info": self._setup_system_info_page,
+            "report": self._setup_report_page,
+            "unsuccessful": self._setup_unsuccessful_page,
+        }
+        self.pages = {}
         
         # Initialize helper classes
         self.system_info_handler = SystemInfo()
@@ -70,96 +143,113 @@ class MainWindow(QMainWindow):
     def load_ui(self, filename):
         """Loads a .ui file and returns the widget."""
         path = os.path.join(self.ui_files_dir, filename)
-        ui_file = QFile(path)
-        if not ui_file.open(QIODevice.ReadOnly):
-            print(f"Cannot open {filename}: {ui_file.errorString()}")
+        try:
+            # One plain read; QUiLoader parses from an in-memory buffer
+            with open(path, 'rb') as f:
+                ui_bytes = QByteArray(f.read())
+        except OSError as e:
+            print(f"Cannot open {filename}: {e}")
             sys.exit(-1)
-        loader = QUiLoader()
-        widget = loader.load(ui_file, self)
-        ui_file.close()
+        ui_buffer = QBuffer(ui_bytes)
+        ui_buffer.open(QIODevice.ReadOnly)
+        widget = self._ui_loader.load(ui_buffer, self)
+        ui_buffer.close()
+        return widget
+
+    def _page(self, page_name):
+        """Returns a page widget, loading it and wiring its signals on first use."""
+        widget = self.pages.get(page_name)
+        if widget is None:
+            widget = self.load_ui(self._page_files[page_name])
+            self.pages[page_name] = widget
+            self.stacked_widget.addWidget(widget)
+            setup = self._page_setup.get(page_name)
+            if setup is not None:
+                setup()
         return widget
 
     def go_to_page(self, page_name):
         """Switches the stacked widget to the specified page."""
-        widget = self.pages.get(page_name)
-        self.stacked_widget.setCurrentWidget(widget)
+        self.stacked_widget.setCurrentWidget(self._page(page_name))
 
     def _setup_home_page(self):
         """Set up signals and slots for the homepage."""
-        home_page = self.pages["home"]
+        home_page = self._page("home")
         home_page.Laptop_pushButton.clicked.connect(lambda: self.go_to_page("info_input"))
         # Android button disabled
 
     def _setup_info_input_page(self):
         """Set up signals and slots for the info input page."""
-        info_page = self.pages["info_input"]
+        info_page = self._page("info_input")
         info_page.pushButton.clicked.connect(self._collect_user_info)
 
         # Enable 'Continue' button only when essential fields are filled
-        required_fields = [
-            info_page.Name_lineEdit,
-            info_page.OrganizationlineEdit,
-            info_page.AssetTag_lineEdit,
-        ]
-        for field in required_fields:
-            field.textChanged.connect(lambda: self._validate_info_input(required_fields))
+        # Validation is debounced: it runs once typing pauses for 150 ms
+        self._required_fields = [getattr(info_page, name) for name in self.REQUIRED_INFO_FIELDS]
+        self._validate_timer = QTimer(self)
+        self._validate_timer.setSingleShot(True)
+        self._validate_timer.setInterval(150)
+        self._validate_timer.timeout.connect(lambda: self._validate_info_input(self._required_fields))
+        for field in self._required_fields:
+            field.textChanged.connect(self._validate_timer.start)
 
     def _setup_system_info_page(self):
         """Set up signals and slots for the system info page."""
-        sys_info_page = self.pages["system_info"]
+        sys_info_page = self._page("system_info")
         sys_info_page.Home_Button.clicked.connect(lambda: self.go_to_page("home"))
-        sys_info_page.RefreshDevices_Button.clicked.connect(self.populate_device_list)
+        sys_info_page.RefreshDevices_Button.clicked.connect(self._refresh_devices)
         sys_info_page.Wipe_Button.clicked.connect(self.start_wiping_process)
         
         # Disable wipe button by default
         sys_info_page.Wipe_Button.setEnabled(False)
         
+        # Every row is one line of text, so Qt can skip per-item size hints
+        sys_info_page.listWidget.setUniformItemSizes(True)
+
         # Connect itemChanged signal to enable/disable wipe button
         sys_info_page.listWidget.itemChanged.connect(self._update_wipe_button_state)
 
 
     def _setup_report_page(self):
         """Set up signals and slots for the report page."""
-        report_page = self.pages["report"]
+        report_page = self._page("report")
         report_page.Home_Button.clicked.connect(lambda: self.go_to_page("home"))
         # Download and Print buttons would need platform-specific logic
         report_page.Download_Button.clicked.connect(self._show_download_info)
 
     def _setup_unsuccessful_page(self):
         """Set up signals and slots for the unsuccessful page."""
-        unsuccessful_page = self.pages["unsuccessful"]
+        unsuccessful_page = self._page("unsuccessful")
         unsuccessful_page.pushButton.clicked.connect(lambda: self.go_to_page("system_info"))
 
 
     def _validate_info_input(self, fields):
         """Check if all required fields on the info page are filled."""
-        info_page = self.pages["info_input"]
+        info_page = self._page("info_input")
         is_valid = all(field.text().strip() for field in fields)
-        info_page.pushButton.setEnabled(is_valid)
+        # Only touch the button when its state flips, to skip no-op repaints
+        if info_page.pushButton.isEnabled() != is_valid:
+            info_page.pushButton.setEnabled(is_valid)
         
+    @Slot()
     def _collect_user_info(self):
         """Collects data from the info input form and proceeds."""
-        info_page = self.pages["info_input"]
-        self.user_data = {
-            "name": info_page.Name_lineEdit.text(),
-            "organization": info_page.OrganizationlineEdit.text(),
-            "title": info_page.Title_lineEdit.text(),
-            "location": info_page.Location_lineEdit.text(),
-            "email": info_page.Email_lineEdit.text(), 
-            "phone": info_page.Phone_lineEdit.text(),
-            "media_property_number": info_page.AssetTag_lineEdit.text(),
-            "source": info_page.Source_lineEdit.text(),
-            "backup_location": info_page.Backup_lineEdit.text(),
-            "notes": info_page.Notes_lineEdit.text(),
-            "destination": info_page.Destination_lineEdit.text()
-        }
+        info_page = self._page("info_input")
+        if self._validate_timer.isActive():
+            # A field changed within the debounce window; validate before leaving
+            self._validate_timer.stop()
+            self._validate_info_input(self._required_fields)
+            if not info_page.pushButton.isEnabled():
+                return
+        self.user_data = {key: getattr(info_page, widget).text() for key, widget in self.INFO_FIELDS}
         self.populate_device_list()
         self.go_to_page("system_info")
 
 
+    @Slot()
     def _update_wipe_button_state(self):
         """Enable Wipe button only if at least one item is checked."""
-        sys_info_page = self.pages["system_info"]
+        sys_info_page = self._page("system_info")
         checked_items = []
         for i in range(sys_info_page.listWidget.count()):
             if sys_info_page.listWidget.item(i).checkState() == Qt.Checked:
@@ -168,15 +258,48 @@ class MainWindow(QMainWindow):
         sys_info_page.Wipe_Button.setEnabled(any(checked_items))
 
 
+    @Slot()
+    def _refresh_devices(self):
+        """Forces a fresh device scan, bypassing the short-lived cache."""
+        self.system_info_handler.invalidate()
+        self.populate_device_list()
+
     def populate_device_list(self):
-        """Fetches storage device info and populates the list."""
-        sys_info_page = self.pages["system_info"]
+        """
+        Starts collecting storage device info in the background; the list is
+        filled by _apply_system_data once the scan completes, so lsblk and
+        /sys reads never block the GUI thread. Does nothing while a scan is
+        already running; its result fills the list.
+        """
+        if self._system_info_worker is not None:
+            return
+        sys_info_page = self._page("system_info")
         list_widget = sys_info_page.listWidget
         list_widget.clear()
+        list_widget.addItem(QListWidgetItem("Refreshing devices…"))
+        sys_info_page.RefreshDevices_Button.setEnabled(False)
+        sys_info_page.Wipe_Button.setEnabled(False)
+
+        # Keep a reference so the worker's signal object outlives run()
+        self._system_info_worker = SystemInfoWorker(self.system_info_handler)
+        self._system_info_worker.signals.finished.connect(self._apply_system_data)
+        QThreadPool.globalInstance().start(self._system_info_worker)
 
-        self.system_data = self.system_info_handler.get_all_info()
+    @Slot(dict)
+    def _apply_system_data(self, system_data):
+        """Populates the device list from a completed background scan."""
+        self._system_info_worker = None
+        sys_info_page = self._page("system_info")
+        list_widget = sys_info_page.listWidget
+        sys_info_page.RefreshDevices_Button.setEnabled(True)
+
+        self.system_data = system_data
         devices = self.system_data.get("storage_devices", [])
 
+        # Batch the rebuild: one repaint at the end and no per-item itemChanged
+        list_widget.setUpdatesEnabled(False)
+        list_widget.blockSignals(True)
+        list_widget.clear()
         for device in devices:
             # Create a user-friendly string for the list item
             item_text = (f"{device.get('name', 'N/A')} - "
@@ -191,10 +314,13 @@ class MainWindow(QMainWindow):
             item.setData(Qt.UserRole, device)
             
             list_widget.addItem(item)
+        list_widget.blockSignals(False)
+        list_widget.setUpdatesEnabled(True)
             
+    @Slot()
     def start_wiping_process(self):
         """Initiates the wiping thread for selected devices."""
-        sys_info_page = self.pages["system_info"]
+        sys_info_page = self._page("system_info")
         self.devices_to_wipe = []
         
         # Compile a list of checked devices
@@ -220,19 +346,37 @@ class MainWindow(QMainWindow):
         
         if msg_box.exec() == QMessageBox.Yes:
             self.go_to_page("loading")
+            self._last_progress = -1
+            self._pending_progress = None
             self.wipe_thread = WipeThread(self.devices_to_wipe)
             self.wipe_thread.progress.connect(self.update_loading_progress)
             self.wipe_thread.finished.connect(self.on_wiping_finished)
             self.wipe_thread.start()
             self.certificate_id = str(uuid.uuid4()) 
 
+    @Slot(int)
     def update_loading_progress(self, value):
-        """Updates the progress bar on the loading page."""
-        loading_page = self.pages["loading"]
+        """Queues a progress bar update; applied by _flush_loading_progress."""
+        self._pending_progress = value
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+
+    @Slot()
+    def _flush_loading_progress(self):
+        """Applies the most recent queued progress value to the loading page."""
+        value, self._pending_progress = self._pending_progress, None
+        if value is None or value == self._last_progress:
+            return
+        self._last_progress = value
+        loading_page = self._page("loading")
         loading_page.progressBar.setValue(value)
 
+    @Slot(bool, str, dict)
     def on_wiping_finished(self, success, message, report_data):
         """Handles the completion of the wiping process."""
+        # Show the final value before leaving the loading page
+        self._progress_timer.stop()
+        self._flush_loading_progress()
         if success:
 
             cert_generator = CertificateGenerator(
@@ -242,27 +386,48 @@ class MainWindow(QMainWindow):
                 wipe_report=report_data,
                 certificate_id=self.certificate_id
             )
-            cert_generator.generate_pdf()
-            self._show_download_info()
-            
-            report_page = self.pages["report"]
-            report_page.ReID_Label.setText(f"Ref. ID: {self.certificate_id}")
-            self.go_to_page("report")
+            # Report generation and signing run off the GUI thread; the
+            # loading page stays up until _on_certificate_ready
+            self._certificate_worker = CertificateWorker(cert_generator)
+            self._certificate_worker.signals.finished.connect(self._on_certificate_ready)
+            QThreadPool.globalInstance().start(self._certificate_worker)
         else:
             print(f"Wiping failed: {message}")
             self.go_to_page("unsuccessful")
+
+    @Slot(str)
+    def _on_certificate_ready(self, error):
+        """Shows the report page once the certificate worker is done."""
+        if error:
+            print(f"Certificate generation failed: {error}")
+            QMessageBox.warning(self, "Certificate Error",
+                                f"The wipe succeeded, but the certificate could not be generated:\n{error}")
+        else:
+            self._show_download_info()
+
+        report_page = self._page("report")
+        report_page.ReID_Label.setText(f"Ref. ID: {self.certificate_id}")
+        self.go_to_page("report")
             
+    @Slot()
     def _show_download_info(self):
         """Shows where the report files are saved."""
-        msg_box = QMessageBox(self)
-        msg_box.setIcon(QMessageBox.Information)
-        msg_box.setText("Reports Generated")
-        msg_box.setInformativeText(f"Certificate files (PDF and JSON) have been saved in the application's root directory with the ID:\n{self.certificate_id}")
-        msg_box.setWindowTitle("Download Information")
-        msg_box.exec()
+        # Built on first use; later clicks only refresh the certificate ID
+        if self._download_msg is None:
+            self._download_msg = QMessageBox(self)
+            self._download_msg.setIcon(QMessageBox.Information)
+            self._download_msg.setText("Reports Generated")
+            self._download_msg.setWindowTitle("Download Information")
+        self._download_msg.setInformativeText(f"Certificate files (PDF and JSON) have been saved in the application's root directory with the ID:\n{self.certificate_id}")
+        self._download_msg.exec()
 
 
 if __name__ == "__main__":
+    # Fail fast before paying for Qt start-up: wiping block devices needs root
+    if platform.system() == "Linux" and os.geteuid() != 0:
+        print("EasyWipe requires root privileges; re-run with sudo.", file=sys.stderr)
+        sys.exit(1)
+
     app = QApplication(sys.argv)
     window = MainWindow()
     window.show()
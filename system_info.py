@@ -1,6 +1,38 @@
+import os
+import re
 import subprocess
-import json
 import platform
+import time
+
+SYS_BLOCK = "/sys/block"
+UDEV_DATA = "/run/udev/data"
+# -d: no slaves, -P: KEY="value" pairs, -o: specify columns
+_LSBLK_CMD = ("lsblk", "-d", "-P", "-o", "NAME,MODEL,SERIAL,SIZE,TYPE")
+_LSBLK_PAIR_RE = re.compile(r'(\w+)="([^"]*)"')
+# Virtual / optical block devices that lsblk would not report as a wipeable disk
+_NON_DISK_PREFIXES = ("loop", "ram", "zram", "dm-", "md", "sr", "nbd")
+
+
+def _human_size(num_bytes):
+    """Formats a byte count the way lsblk does, e.g. '1T', '931.5G', '512M'."""
+    value = float(num_bytes)
+    for unit in ("B", "K", "M", "G", "T", "P"):
+        if value < 1024 or unit == "P":
+            break
+        value /= 1024
+    return f"{round(value, 1):g}{unit}"
+
+
+def _parse_block(line):
+    """
+    Turns one line of lsblk -P output into a device dict with lowercase keys,
+    None for empty columns (as the JSON output had) and a /dev/ path.
+    """
+    device = {key.lower(): value or None for key, value in _LSBLK_PAIR_RE.findall(line)}
+    name = device.get('name') or ''
+    if not name.startswith('/dev/'):
+        device['name'] = '/dev/' + name
+    return device
 
 class SystemInfo:
     """
@@ -8,11 +40,35 @@ class SystemInfo:
     Focuses on Linux commands suitable for a bootable environment.
     """
 
+    # How long a device listing is reused before lsblk is run again (seconds)
+    DEVICE_CACHE_TTL = 2.0
+
+    def __init__(self):
+        self._device_cache = None  # (monotonic timestamp, list of devices)
+        self._system_details = None  # DMI strings never change after boot
+
+    def invalidate(self):
+        """Drops the cached device listing so the next call re-queries the system."""
+        self._device_cache = None
+
     def get_storage_devices(self):
         """
         Retrieves information about storage devices using lsblk.
-        Returns a list of dictionaries, one for each device.
+        Returns a list of dictionaries, one for each device. Results are
+        reused for DEVICE_CACHE_TTL seconds to avoid re-spawning lsblk on
+        back-to-back page transitions.
         """
+        if self._device_cache is not None:
+            timestamp, devices = self._device_cache
+            if time.monotonic() - timestamp < self.DEVICE_CACHE_TTL:
+                return [dict(device) for device in devices]
+
+        devices = self._query_storage_devices()
+        self._device_cache = (time.monotonic(), devices)
+        return [dict(device) for device in devices]
+
+    def _query_storage_devices(self):
+        """Runs the actual device discovery (uncached)."""
         if platform.system() != "Linux":
             # Provide mock data for non-Linux systems (Windows/macOS for development)
             return [
@@ -21,28 +77,80 @@ class SystemInfo:
             ]
 
         try:
-            # -d: no slaves, -J: JSON output, -o: specify columns
-            command = ["lsblk", "-d", "-J", "-o", "NAME,MODEL,SERIAL,SIZE,TYPE"]
-            result = subprocess.run(command, capture_output=True, text=True, check=True)
-            data = json.loads(result.stdout)
+            return self._storage_devices_from_sysfs()
+        except (OSError, ValueError) as e:
+            print(f"Could not read {SYS_BLOCK}, falling back to lsblk: {e}")
+
+        try:
+            result = subprocess.run(_LSBLK_CMD, capture_output=True, text=True, check=True)
+            devices = (_parse_block(line) for line in result.stdout.splitlines())
             
-            # Filter for disks only and prepend /dev/ if necessary
-            devices = []
-            for device in data.get("blockdevices", []):
-                if device.get("type") == "disk":
-                    if not device['name'].startswith('/dev/'):
-                        device['name'] = f"/dev/{device['name']}"
-                    devices.append(device)
-            return devices
+            # Filter for disks only
+            return [d for d in devices if d.get("type") == "disk"]
             
-        except (subprocess.CalledProcessError, FileNotFoundError, json.JSONDecodeError) as e:
+        except (subprocess.CalledProcessError, FileNotFoundError) as e:
             print(f"Error getting storage devices: {e}")
             return []
 
+    def _storage_devices_from_sysfs(self):
+        """
+        Builds the device list straight from /sys/block instead of spawning
+        lsblk. Returns the same keys the lsblk fallback does (name, model, serial,
+        size, type).
+        """
+        devices = []
+        for name in sorted(os.listdir(SYS_BLOCK)):
+            base = os.path.join(SYS_BLOCK, name)
+            # Only hardware-backed disks have a 'device' link
+            if name.startswith(_NON_DISK_PREFIXES) or not os.path.exists(os.path.join(base, "device")):
+                continue
+            # Hidden gendisks (e.g. NVMe multipath paths like nvme0c0n1) have no
+            # /dev node; lsblk skips them too
+            if self._read_optional(os.path.join(base, "hidden")) == "1":
+                continue
+            sectors = int(self._read_sys_file(os.path.join(base, "size")))  # always 512-byte units
+            devices.append({
+                'name': f"/dev/{name}",
+                'model': self._read_optional(os.path.join(base, "device", "model")),
+                'serial': self._read_serial(base),
+                'size': _human_size(sectors * 512),
+                'type': 'disk',
+            })
+        return devices
+
+    def _read_serial(self, base):
+        """
+        Reads a disk serial the way lsblk does: the udev property first, then
+        the sysfs attribute exposed by NVMe/MMC/virtio drivers.
+        """
+        dev_number = self._read_optional(os.path.join(base, "dev"))
+        if dev_number:
+            try:
+                with open(os.path.join(UDEV_DATA, f"b{dev_number}"), 'r') as f:
+                    for line in f:
+                        if line.startswith("E:ID_SERIAL_SHORT="):
+                            return line.split("=", 1)[1].strip()
+            except OSError:
+                pass
+        return self._read_optional(os.path.join(base, "device", "serial"))
+
+    def _read_optional(self, path):
+        """Returns the stripped contents of a sysfs attribute, or None if absent/empty."""
+        try:
+            return self._read_sys_file(path).strip() or None
+        except OSError:
+            return None
+
     def get_system_details(self):
         """
         Retrieves basic system details like manufacturer and model.
+        The values are read once and reused for the lifetime of the instance.
         """
+        if self._system_details is None:
+            self._system_details = self._query_system_details()
+        return dict(self._system_details)
+
+    def _query_system_details(self):
         if platform.system() != "Linux":
             return {'vendor': 'Mock Computer Inc.', 'model': 'System 9000'}
 
@@ -55,9 +163,16 @@ class SystemInfo:
             return {'vendor': 'N/A', 'model': 'N/A'}
             
     def _read_sys_file(self, path):
-        """Helper to read a file from the /sys filesystem."""
-        with open(path, 'r') as f:
-            return f.read()
+        """
+        Helper to read a file from the /sys filesystem. sysfs attributes are
+        at most one page long, so a single os.read() returns the whole value
+        without building a Python file object.
+        """
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            return os.read(fd, 4096).decode(errors='replace')
+        finally:
+            os.close(fd)
 
     def get_all_info(self):
         """Convenience method to get all information at once."""
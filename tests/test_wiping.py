@@ -0,0 +1,59 @@
+import asyncio
+import sys
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+from wiping import WipeThread, _parse_hdparm_security
+
+# Trimmed 'hdparm -I' output for a SATA SSD, keeping the real indentation
+HDPARM_IDENTIFY = """
+/dev/sda:
+
+ATA device, with non-removable media
+	Model Number:       Samsung SSD 860 EVO 500GB
+	Serial Number:      S3Z1NB0K123456X
+Commands/features:
+	Enabled	Supported:
+	   *	SMART feature set
+Security: 
+	Master password revision code = 65534
+		supported
+	not	enabled
+	not	locked
+	not	frozen
+	not	expired: security count
+		supported: enhanced erase
+	2min for SECURITY ERASE UNIT. 8min for ENHANCED SECURITY ERASE UNIT.
+Logical Unit WWN Device Identifier: 5002538e40a1b2c3
+	NAA		: 5
+Checksum: correct
+"""
+
+
+def test_hdparm_security_parsed_through_run_command(tmp_path):
+    fixture = tmp_path / "hdparm_identify.txt"
+    fixture.write_text(HDPARM_IDENTIFY)
+
+    output = asyncio.run(WipeThread([])._run_command(("cat", str(fixture))))
+    caps = _parse_hdparm_security(output)
+
+    assert caps == _parse_hdparm_security(HDPARM_IDENTIFY)
+    assert caps["supported"] and caps["enhanced_erase"]
+    assert not (caps["enabled"] or caps["locked"] or caps["frozen"])
+    assert "SECURITY ERASE UNIT" in caps["erase_time"]
+
+
+def test_crlf_split_across_reads_is_one_line_ending():
+    # The child pauses between the '\r' and the '\n', so they arrive in
+    # separate reads
+    script = (
+        "import sys, time\n"
+        "sys.stdout.write('a' * 65535 + '\\r'); sys.stdout.flush()\n"
+        "time.sleep(0.2)\n"
+        "sys.stdout.write('\\nb\\r\\n')\n"
+    )
+    output = asyncio.run(WipeThread([])._run_command((sys.executable, "-c", script)))
+
+    assert output.split("\n") == ["a" * 65535, "b"]
@@ -6,15 +6,37 @@ Each class represents a different screen/page in the application.
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
     QLineEdit, QListWidget, QProgressBar, QGroupBox, QGridLayout,
-    QTextEdit, QFrame, QSpacerItem, QSizePolicy
+    QSpacerItem, QSizePolicy
 )
-from PySide6.QtCore import Qt, QSize
-from PySide6.QtGui import QFont, QPixmap, QIcon
+from PySide6.QtCore import Qt, QBuffer, QByteArray, QIODevice
+from PySide6.QtGui import QFont
 from PySide6.QtUiTools import QUiLoader
-from PySide6.QtCore import QIODevice
+from functools import lru_cache
 import os
 
 
+@lru_cache(maxsize=None)
+def _ui_bytes(path: str) -> QByteArray:
+    """Reads a .ui file once; later page instances reuse the cached bytes."""
+    with open(path, 'rb') as f:
+        return QByteArray(f.read())
+
+
+@lru_cache(maxsize=1)
+def _ui_loader() -> QUiLoader:
+    """One QUiLoader (and its widget factory registry) shared by every page."""
+    return QUiLoader()
+
+
+@lru_cache(maxsize=None)
+def _font(size: int, bold: bool = False, family: str = "Noto Sans") -> QFont:
+    """
+    Returns a shared QFont for the given style. Built on first use (after the
+    QApplication exists) and reused by every page through Qt's implicit sharing.
+    """
+    return QFont(family, size, QFont.Bold) if bold else QFont(family, size)
+
+
 class BasePage(QWidget):
     """Base class for all UI pages."""
     
@@ -32,10 +54,10 @@ class BasePage(QWidget):
     
     def load_ui_file(self):
         """Load UI from .ui file."""
-        loader = QUiLoader()
-        ui_file = open(self.ui_file_path, 'r')
-        widget = loader.load(ui_file, self)
-        ui_file.close()
+        ui_buffer = QBuffer(_ui_bytes(self.ui_file_path))
+        ui_buffer.open(QIODevice.ReadOnly)
+        widget = _ui_loader().load(ui_buffer, self)
+        ui_buffer.close()
         
         # Set the loaded widget as the main widget
         layout = QVBoxLayout(self)
@@ -61,13 +83,15 @@ class HomePage(BasePage):
     
     def create_ui(self):
         """Create home page UI programmatically."""
+        # One stylesheet rule sizes all nav buttons (min below max)
+        self.setStyleSheet("QPushButton#navBtn { min-width: 100px; max-width: 128px; }")
         layout = QVBoxLayout(self)
         layout.setContentsMargins(20, 20, 20, 20)
         layout.setSpacing(7)
         
         # Title
         title_label = QLabel("Easy Data Wiping :)")
-        title_label.setFont(QFont("Noto Sans", 48, QFont.Bold))
+        title_label.setFont(_font(48, bold=True))
         title_label.setMinimumHeight(120)
         title_label.setMaximumHeight(120)
         title_label.setAlignment(Qt.AlignBottom)
@@ -79,7 +103,7 @@ class HomePage(BasePage):
             "Permanently erases all data from your device,\n"
             "ensuring compliance with NIST SP 800-88."
         )
-        desc_label.setFont(QFont("Noto Sans", 12))
+        desc_label.setFont(_font(12))
         desc_label.setMinimumSize(408, 120)
         desc_label.setMaximumHeight(60)
         layout.addWidget(desc_label)
@@ -94,13 +118,11 @@ class HomePage(BasePage):
         left_layout = QVBoxLayout()
         
         github_button = QPushButton("Github")
-        github_button.setMinimumWidth(128)
-        github_button.setMaximumWidth(100)
+        github_button.setObjectName("navBtn")
         left_layout.addWidget(github_button)
         
         license_button = QPushButton("License")
-        license_button.setMinimumWidth(128)
-        license_button.setMaximumWidth(100)
+        license_button.setObjectName("navBtn")
         left_layout.addWidget(license_button)
         
         button_layout.addLayout(left_layout)
@@ -110,13 +132,11 @@ class HomePage(BasePage):
         right_layout = QVBoxLayout()
         
         laptop_button = QPushButton("Laptop/PC")
-        laptop_button.setMinimumWidth(128)
-        laptop_button.setMaximumWidth(100)
+        laptop_button.setObjectName("navBtn")
         right_layout.addWidget(laptop_button)
         
         android_button = QPushButton("Android")
-        android_button.setMinimumWidth(128)
-        android_button.setMaximumWidth(100)
+        android_button.setObjectName("navBtn")
         android_button.setEnabled(False)  # Disabled as per UI
         right_layout.addWidget(android_button)
         
@@ -247,21 +267,22 @@ class SystemInfoPage(BasePage):
         # Home Button
         home_layout = QHBoxLayout()
         self.home_button = QPushButton("Home")
-        self.home_button.setFont(QFont("Noto Sans", 14))
+        self.home_button.setFont(_font(14))
         home_layout.addWidget(self.home_button)
         home_layout.addStretch()
         layout.addLayout(home_layout)
         
         # Device List
         self.device_list = QListWidget()
-        self.device_list.setFont(QFont("Noto Sans", 12))
+        self.device_list.setFont(_font(12))
         self.device_list.setSelectionMode(QListWidget.ExtendedSelection)
+        self.device_list.setUniformItemSizes(True)
         layout.addWidget(self.device_list)
         
         # Warning
         warning_layout = QHBoxLayout()
         warning_label = QLabel("⚠️Warning: ")
-        warning_label.setFont(QFont("Noto Color Emoji", 16, QFont.Bold))
+        warning_label.setFont(_font(16, bold=True, family="Noto Color Emoji"))
         warning_label.setStyleSheet("color: rgb(246, 211, 45);")
         warning_layout.addWidget(warning_label)
         layout.addLayout(warning_layout)
@@ -271,7 +292,7 @@ class SystemInfoPage(BasePage):
             "All shown drives will be permanently erased.\n"
             "This action cannot be undone. Ensure backups are complete before proceeding."
         )
-        warning_text.setFont(QFont("Noto Sans", 12))
+        warning_text.setFont(_font(12))
         warning_text.setWordWrap(True)
         layout.addWidget(warning_text)
         
@@ -279,13 +300,13 @@ class SystemInfoPage(BasePage):
         button_layout = QHBoxLayout()
         
         self.refresh_button = QPushButton("Refresh Devices")
-        self.refresh_button.setFont(QFont("Noto Sans", 14))
+        self.refresh_button.setFont(_font(14))
         button_layout.addWidget(self.refresh_button)
         
         button_layout.addStretch()
         
         self.wipe_button = QPushButton("Wipe")
-        self.wipe_button.setFont(QFont("Noto Sans", 14))
+        self.wipe_button.setFont(_font(14))
         button_layout.addWidget(self.wipe_button)
         
         layout.addLayout(button_layout)
@@ -304,32 +325,24 @@ class LoadingPage(BasePage):
     
     def create_ui(self):
         """Create loading page UI programmatically."""
-        layout = QVBoxLayout(self)
+        # One grid with stretch rows above and below replaces nested
+        # spacer/box layouts
+        layout = QGridLayout(self)
         layout.setContentsMargins(20, 20, 20, 20)
         layout.setSpacing(6)
-        
-        # Top spacer
-        layout.addItem(QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding))
+        layout.setRowStretch(0, 1)
+        layout.setRowStretch(3, 1)
         
         # Progress Bar
         self.progress_bar = QProgressBar()
-        self.progress_bar.setFont(QFont("Noto Sans", 12))
+        self.progress_bar.setFont(_font(12))
         self.progress_bar.setValue(24)
-        layout.addWidget(self.progress_bar)
+        layout.addWidget(self.progress_bar, 1, 0)
         
         # Status Label
-        status_layout = QHBoxLayout()
-        status_layout.addStretch()
-        
         self.status_label = QLabel("In Progress....")
-        self.status_label.setFont(QFont("Noto Sans", 16))
-        status_layout.addWidget(self.status_label)
-        
-        status_layout.addStretch()
-        layout.addLayout(status_layout)
-        
-        # Bottom spacer
-        layout.addItem(QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding))
+        self.status_label.setFont(_font(16))
+        layout.addWidget(self.status_label, 2, 0, Qt.AlignCenter)
 
 
 class ReportPage(BasePage):
@@ -351,7 +364,7 @@ class ReportPage(BasePage):
         
         # Home Button
         self.home_button = QPushButton("Home")
-        self.home_button.setFont(QFont("Noto Sans", 12))
+        self.home_button.setFont(_font(12))
         self.home_button.setMinimumWidth(100)
         layout.addWidget(self.home_button)
         
@@ -360,7 +373,7 @@ class ReportPage(BasePage):
         success_layout.addStretch()
         
         self.success_label = QLabel("Wiped Successful!")
-        self.success_label.setFont(QFont("Noto Sans", 24, QFont.Bold))
+        self.success_label.setFont(_font(24, bold=True))
         self.success_label.setStyleSheet("color: rgb(38, 162, 105);")
         success_layout.addWidget(self.success_label)
         
@@ -372,7 +385,7 @@ class ReportPage(BasePage):
         ref_layout.addStretch()
         
         self.reference_label = QLabel("Ref. ID: ")
-        self.reference_label.setFont(QFont("Noto Sans", 18))
+        self.reference_label.setFont(_font(18))
         self.reference_label.setStyleSheet("color: rgb(224, 27, 36);")
         ref_layout.addWidget(self.reference_label)
         
@@ -386,14 +399,14 @@ class ReportPage(BasePage):
         button_layout = QHBoxLayout()
         
         self.verification_button = QPushButton("Verification Link")
-        self.verification_button.setFont(QFont("Noto Sans", 12))
+        self.verification_button.setFont(_font(12))
         self.verification_button.setMinimumWidth(100)
         button_layout.addWidget(self.verification_button)
         
         button_layout.addStretch()
         
         self.print_button = QPushButton("Print")
-        self.print_button.setFont(QFont("Noto Sans", 12))
+        self.print_button.setFont(_font(12))
         self.print_button.setMinimumWidth(100)
         button_layout.addWidget(self.print_button)
         
@@ -404,7 +417,7 @@ class ReportPage(BasePage):
         download_layout.addStretch()
         
         self.download_button = QPushButton("Download")
-        self.download_button.setFont(QFont("Noto Sans", 12))
+        self.download_button.setFont(_font(12))
         self.download_button.setMinimumWidth(100)
         download_layout.addWidget(self.download_button)
         
@@ -424,37 +437,20 @@ class UnsuccessfulPage(BasePage):
     
     def create_ui(self):
         """Create unsuccessful page UI programmatically."""
-        layout = QVBoxLayout(self)
+        # Single grid: stretch rows 0, 2 and 4 take the place of the spacers
+        layout = QGridLayout(self)
         layout.setContentsMargins(20, 20, 20, 20)
         layout.setSpacing(7)
-        
-        # Top spacer
-        layout.addItem(QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding))
+        layout.setRowStretch(0, 1)
+        layout.setRowStretch(2, 1)
+        layout.setRowStretch(4, 1)
         
         # Error Label
-        error_layout = QHBoxLayout()
-        error_layout.addStretch()
-        
         self.error_label = QLabel("Wipe Unsuccessful")
-        self.error_label.setFont(QFont("Noto Sans", 36))
+        self.error_label.setFont(_font(36))
         self.error_label.setStyleSheet("color: rgb(224, 27, 36);")
-        error_layout.addWidget(self.error_label)
-        
-        error_layout.addStretch()
-        layout.addLayout(error_layout)
-        
-        # Spacer
-        layout.addItem(QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding))
+        layout.addWidget(self.error_label, 1, 0, Qt.AlignCenter)
         
         # Retry Button
-        retry_layout = QHBoxLayout()
-        retry_layout.addStretch()
-        
         self.retry_button = QPushButton("Retry")
-        retry_layout.addWidget(self.retry_button)
-        
-        retry_layout.addStretch()
-        layout.addLayout(retry_layout)
-        
-        # Bottom spacer
-        layout.addItem(QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding))
+        layout.addWidget(self.retry_button, 3, 0, Qt.AlignCenter)
@@ -3,29 +3,35 @@ import datetime
 from cryptography import x509
 from cryptography.x509.oid import NameOID
 from cryptography.hazmat.primitives import hashes, serialization
-from cryptography.hazmat.primitives.asymmetric import rsa
+from cryptography.hazmat.primitives.asymmetric import ec
 from cryptography.hazmat.primitives.serialization import pkcs12
 from cryptography.hazmat.backends import default_backend
 
-def create_p12(filename="certificate.p12", password="123"):
-    # 1. Generate private key
-    private_key = rsa.generate_private_key(
-        public_exponent=65537,
-        key_size=2048,
-        backend=default_backend()
-    )
+# Constant subject (and, self-signed, issuer) name for the demo certificate
+_SUBJECT = x509.Name([
+    x509.NameAttribute(NameOID.COUNTRY_NAME, "US"),
+    x509.NameAttribute(NameOID.STATE_OR_PROVINCE_NAME, "California"),
+    x509.NameAttribute(NameOID.LOCALITY_NAME, "San Francisco"),
+    x509.NameAttribute(NameOID.ORGANIZATION_NAME, "My Company"),
+    x509.NameAttribute(NameOID.COMMON_NAME, "PDF Signer Demo"),
+])
+
+def _private_key():
+    """
+    Generates a fresh signing key. ECDSA P-256 keys take microseconds to
+    create where RSA-2048 needs a prime search, and P-256 signatures are
+    accepted by common PDF validators. The key is never written to disk
+    unencrypted.
+    """
+    return ec.generate_private_key(ec.SECP256R1(), backend=default_backend())
+
+
+def _build_cert(private_key):
+    """Builds the self-signed X.509 certificate for private_key."""
+    # Certificate subject / issuer (self-signed)
+    subject = issuer = _SUBJECT
 
-    # 2. Certificate subject / issuer (self-signed)
-    subject = issuer = x509.Name([
-        x509.NameAttribute(NameOID.COUNTRY_NAME, "US"),
-        x509.NameAttribute(NameOID.STATE_OR_PROVINCE_NAME, "California"),
-        x509.NameAttribute(NameOID.LOCALITY_NAME, "San Francisco"),
-        x509.NameAttribute(NameOID.ORGANIZATION_NAME, "My Company"),
-        x509.NameAttribute(NameOID.COMMON_NAME, "PDF Signer Demo"),
-    ])
-
-    # 3. Build X.509 certificate
-    cert = (
+    return (
         x509.CertificateBuilder()
         .subject_name(subject)
         .issuer_name(issuer)
@@ -36,8 +42,10 @@ def create_p12(filename="certificate.p12", password="123"):
         .sign(private_key, hashes.SHA256(), default_backend())
     )
 
-    # 4. Serialize to PKCS#12 (.p12)
-    p12_data = pkcs12.serialize_key_and_certificates(
+
+def _serialize_p12(private_key, cert, password):
+    """Serializes key and certificate to password-protected PKCS#12 bytes."""
+    return pkcs12.serialize_key_and_certificates(
         name=b"My PDF Signer",
         key=private_key,
         cert=cert,
@@ -45,9 +53,19 @@ def create_p12(filename="certificate.p12", password="123"):
         encryption_algorithm=serialization.BestAvailableEncryption(password.encode())
     )
 
-    # 5. Save to file
-    with open(filename, "wb") as f:
+
+def create_p12(filename="certificate.p12", password="123"):
+    # 1. Private key
+    private_key = _private_key()
+
+    # 2. Build X.509 certificate and serialize to PKCS#12 (.p12)
+    p12_data = _serialize_p12(private_key, _build_cert(private_key), password)
+
+    # 3. Save to file atomically, so a concurrent reader never sees a partial P12
+    tmp_filename = f"{filename}.{os.getpid()}.tmp"
+    with open(tmp_filename, "wb") as f:
         f.write(p12_data)
+    os.replace(tmp_filename, filename)
 
     print(f"✅ Created PKCS#12 certificate: {filename}")
     print(f"   Password: {password}")
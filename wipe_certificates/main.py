@@ -1,10 +1,18 @@
+import io
 import os
 import uuid
 import json
 import sys
+import fcntl
+from concurrent.futures import ThreadPoolExecutor
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from wipe_certificates.pdf_generator import generate_pdf
 from wipe_certificates.pdf_signer import sign_pdf
 from wipe_certificates.create_p12 import create_p12
+from wipe_certificates.paths import JSON_FOLDER, PDF_FOLDER, report_paths
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -21,15 +29,48 @@ P12_FILE = os.getenv("P12_FILE", "certificate.p12")
 P12_PASSWORD = os.getenv("P12_PASSWORD", "123")
 
 
-JSON_FOLDER = "json_reports"
-PDF_FOLDER = "pdf_reports"
 os.makedirs(JSON_FOLDER, exist_ok=True)
 os.makedirs(PDF_FOLDER, exist_ok=True)
 
-def richa(data, report_uuid):
-    print("=== PDF GENERATION AND SIGNING SCRIPT ===")
+# Optional log-pipeline output: compact JSON, and/or one shared JSONL file
+JSON_COMPACT = os.getenv("JSON_COMPACT", "").lower() in ("1", "true", "yes")
+JSONL_FILE = os.getenv("JSONL_FILE")
+
+def encode_json(data, compact=False):
+    """Serialize report data to UTF-8 bytes, indented unless compact"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if not compact:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    if compact:
+        return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+def append_jsonl(data, path):
+    """
+    Append one report as a single line to a shared JSONL file. An exclusive
+    flock serializes appends across threads and the generate_batch worker
+    processes alike.
+    """
+    line = encode_json(data, compact=True) + b"\n"
+    with open(path, "ab") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        f.write(line)
+
+def _write_json(data, json_filename):
+    """Write the JSON report (or append it to JSONL_FILE when set)"""
+    if JSONL_FILE:
+        append_jsonl(data, JSONL_FILE)
+        print(f"✓ JSON appended to: {JSONL_FILE}")
+    else:
+        # Single write of pre-encoded bytes instead of many small text writes
+        with open(json_filename, "wb") as f:
+            f.write(encode_json(data, compact=JSON_COMPACT))
+        print(f"✓ JSON saved with UUID: {json_filename}")
 
-    # Create P12 certificate if it doesn't exist
+def ensure_p12():
+    """Create the P12 signing certificate if it doesn't exist yet"""
     if not os.path.exists(P12_FILE):
         print("\n[0] Creating P12 certificate...")
         create_p12(P12_FILE, P12_PASSWORD)
@@ -37,6 +78,11 @@ def richa(data, report_uuid):
     else:
         print(f"\n[0] Certificate already exists: {P12_FILE}, skipping creation")
 
+def richa(data, report_uuid, json_filename=None, signed_pdf_path=None):
+    print("=== PDF GENERATION AND SIGNING SCRIPT ===")
+
+    ensure_p12()
+
     # print("\n[1] Loading JSON data...")
     # with open(INPUT_JSON, "r", encoding="utf-8") as f:
     #     data = json.load(f)
@@ -44,24 +90,32 @@ def richa(data, report_uuid):
 
     data["report_uuid"] = report_uuid
 
-    json_filename = os.path.join(JSON_FOLDER, f"sanitization_report_{report_uuid}.json")
-    with open(json_filename, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=4)
-    print(f"✓ JSON saved with UUID: {json_filename}")
+    if json_filename is None or signed_pdf_path is None:
+        default_json, default_pdf = report_paths(report_uuid)
+        json_filename = json_filename or default_json
+        signed_pdf_path = signed_pdf_path or default_pdf
+    # The JSON and PDF outputs are independent; write the JSON on a worker
+    # while the PDF is built
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        json_future = executor.submit(_write_json, data, json_filename)
 
-   
-    pdf_filename = os.path.join(PDF_FOLDER, f"unsigned_report_{report_uuid}.pdf")
-    print("\n[2] Generating PDF...")
-    generate_pdf(data, filename=pdf_filename)
-    print(f"✓ PDF generated: {pdf_filename}")
+        # The unsigned PDF only exists to be signed, so keep it in memory
+        print("\n[2] Generating PDF...")
+        unsigned_pdf = io.BytesIO()
+        generate_pdf(data, filename=unsigned_pdf)
+        unsigned_pdf.seek(0)
+        print(f"✓ PDF generated ({unsigned_pdf.getbuffer().nbytes} bytes in memory)")
 
-    print("\n[3] Signing PDF...")
-    signed_pdf_path = os.path.join(PDF_FOLDER, f"sanitization_report_{report_uuid}.pdf")
-    sign_pdf(input_pdf=pdf_filename, output_pdf=signed_pdf_path, p12_file=P12_FILE, password=P12_PASSWORD)
+        json_future.result()  # re-raise any JSON write error here
 
-    if os.path.exists(signed_pdf_path):
-        os.remove(pdf_filename)
-        print(f"✓ Unsigned PDF deleted: {pdf_filename}")
+    print("\n[3] Signing PDF...")
+    unsigned_bytes = unsigned_pdf.getvalue()  # sign_pdf closes the stream
+    if sign_pdf(input_pdf=unsigned_pdf, output_pdf=signed_pdf_path, p12_file=P12_FILE, password=P12_PASSWORD) is None:
+        # Keep the unsigned report so the wipe is still documented
+        unsigned_path = os.path.join(PDF_FOLDER, f"unsigned_report_{report_uuid}.pdf")
+        with open(unsigned_path, "wb") as f:
+            f.write(unsigned_bytes)
+        raise RuntimeError(f"PDF signing failed; unsigned report saved to {unsigned_path}")
 
     print(f"✓ PDF signed successfully: {signed_pdf_path}")
 
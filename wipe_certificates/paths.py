@@ -0,0 +1,14 @@
+# paths.py
+# Report output locations. Kept free of heavy imports and side effects so the
+# GUI can name report files without loading the PDF/signing pipeline.
+import os
+
+JSON_FOLDER = "json_reports"
+PDF_FOLDER = "pdf_reports"
+
+def report_paths(report_uuid):
+    """Return the (json, signed pdf) output paths for a report ID."""
+    return (
+        os.path.join(JSON_FOLDER, f"sanitization_report_{report_uuid}.json"),
+        os.path.join(PDF_FOLDER, f"sanitization_report_{report_uuid}.pdf"),
+    )
@@ -1,24 +1,39 @@
 # pdf_signer.py
 import os
+from functools import lru_cache
 from pyhanko.pdf_utils.incremental_writer import IncrementalPdfFileWriter
 from pyhanko.sign.fields import SigFieldSpec, append_signature_field, VisibleSigSettings
 from pyhanko.sign.signers.pdf_signer import PdfSigner, PdfSignatureMetadata
 from pyhanko.sign.signers.pdf_cms import SimpleSigner
 
+@lru_cache(maxsize=4)
+def _load_signer(p12_file, password, mtime):
+    """
+    Decrypts and parses a P12 once per (path, password, mtime). The mtime
+    is only part of the cache key, so a replaced certificate is reloaded.
+    """
+    return SimpleSigner.load_pkcs12(
+        p12_file,
+        passphrase=password.encode("utf-8")
+    )
+
 def sign_pdf(input_pdf, output_pdf, p12_file, password):
     """
     Load a P12 certificate, sign the PDF, and save the output.
-    Signature will be placed on the last page.
+    Signature will be placed on the last page. input_pdf may be a path or a
+    seekable binary stream holding the unsigned PDF.
     """
     try:
         # Load signer from the .p12 file
-        signer = SimpleSigner.load_pkcs12(
-            p12_file,
-            passphrase=password.encode("utf-8")
-        )
+        signer = _load_signer(p12_file, password, os.stat(p12_file).st_mtime_ns)
+        if signer is None:
+            # load_pkcs12 reports failures by returning None; don't keep that
+            _load_signer.cache_clear()
+            raise ValueError(f"could not load signer from '{p12_file}'")
 
-        # Open input PDF and prepare writer
-        with open(input_pdf, "rb") as doc:
+        # Open input PDF (unless already a stream) and prepare writer
+        doc = input_pdf if hasattr(input_pdf, "read") else open(input_pdf, "rb")
+        with doc:
             writer = IncrementalPdfFileWriter(doc)
 
             # Get last page index
@@ -47,7 +62,8 @@ def sign_pdf(input_pdf, output_pdf, p12_file, password):
             with open(output_pdf, "wb") as out:
                 pdf_signer.sign_pdf(writer, output=out)
 
-        print(f"✅ Successfully signed '{input_pdf}' → '{output_pdf}'")
+        source = input_pdf if isinstance(input_pdf, str) else "in-memory PDF"
+        print(f"✅ Successfully signed '{source}' → '{output_pdf}'")
         return output_pdf
 
     except Exception as e:
@@ -0,0 +1,55 @@
+from functools import lru_cache
+from PIL import Image, ImageDraw, ImageFont
+
+PAGE_SIZE = (850, 1100)  # Letter at 100 dpi
+MARGIN = 40
+LABEL_WIDTH = 260
+LINE_HEIGHT = 22
+
+SECTIONS = (
+    ("1. Person Performing Sanitization", "personPerformingSanitization"),
+    ("2. Media Information", "mediaInformation"),
+    ("3. Sanitization Details", "sanitizationDetails"),
+    ("4. Media Destination", "mediaDestination"),
+    ("5. Validation", "validation"),
+)
+
+@lru_cache(maxsize=None)
+def _font(size, bold=False):
+    """Load a TrueType font once per size/weight, falling back to Pillow's default at the same size"""
+    name = "DejaVuSans-Bold.ttf" if bold else "DejaVuSans.ttf"
+    try:
+        return ImageFont.truetype(name, size)
+    except OSError:
+        return ImageFont.load_default(size)  # sized built-in font (Pillow >= 10.1)
+
+def generate_png(data, filename):
+    """Render the report as a single unsigned PNG page (no PDF pipeline)"""
+    image = Image.new("RGB", PAGE_SIZE, "white")
+    draw = ImageDraw.Draw(image)
+    label_font, value_font = _font(12, bold=True), _font(12)
+    heading_font = _font(16, bold=True)
+
+    # --- Title ---
+    title = "MEDIA SANITIZATION REPORT"
+    title_font = _font(24, bold=True)
+    title_width = draw.textlength(title, font=title_font)
+    draw.text(((PAGE_SIZE[0] - title_width) / 2, MARGIN), title, font=title_font, fill="black")
+    y = MARGIN + 50
+
+    # --- UUID ---
+    draw.text((MARGIN, y), f"Report ID: {data.get('report_uuid', 'N/A')}", font=label_font, fill="black")
+    y += 2 * LINE_HEIGHT
+
+    # --- Sections ---
+    for heading, key in SECTIONS:
+        draw.text((MARGIN, y), heading, font=heading_font, fill="black")
+        y += LINE_HEIGHT + 6
+        for k, v in data.get(key, {}).items():
+            draw.text((MARGIN, y), f"{k.replace('_',' ').title()}:", font=label_font, fill="black")
+            draw.text((MARGIN + LABEL_WIDTH, y), "" if v is None else str(v), font=value_font, fill="black")
+            y += LINE_HEIGHT
+        y += LINE_HEIGHT
+
+    image.save(filename, "PNG")
+    print(f"PNG generated: {filename}")
@@ -1,7 +1,11 @@
 import os
+import re
 import time
+import json
+import asyncio
 import subprocess
 import stat
+from collections import deque
 from datetime import datetime
 from PySide6.QtCore import QThread, Signal
 
@@ -10,6 +14,67 @@ from PySide6.QtCore import QThread, Signal
 # It must be launched with 'sudo python3 main.py'.
 # Misuse of these commands can lead to PERMANENT DATA LOSS.
 
+# Constant argv prefixes for the wipe tools; the device path is appended per call
+_NVME_SANITIZE_CRYPTO = ("nvme", "sanitize", "-a", "2")  # sanact=2: crypto erase
+_NVME_FORMAT = ("nvme", "format")
+_NVME_ID_CTRL = ("nvme", "id-ctrl", "-o", "json")
+_HDPARM_USER = ("hdparm", "--user-master", "user")
+_HDPARM_IDENTIFY = ("hdparm", "-I")
+_BLKDISCARD = ("blkdiscard", "-f")
+# 'stdbuf -oL' forces shred's standard output to be line-buffered
+_SHRED_CMD = ("stdbuf", "-oL", "shred", "-v")
+# Overwrite method -> (shred pass arguments, total passes written)
+_OVERWRITE_METHODS = {
+    "nist-clear": (("-n", "1"), 1),       # NIST SP 800-88 Clear: one random pass
+    "dod-5220": (("-n", "2", "-z"), 3),   # two random passes, then zeros
+}
+
+# Matches 'shred -v' progress, e.g. "shred: /dev/sda: pass 2/3 (random)...4.0GiB/100GiB 4%"
+_SHRED_PROGRESS_RE = re.compile(r"pass (\d+)/(\d+)(?:.*?(\d+)%)?")
+# Methods that meet NIST SP 800-88 Purge; any other recorded method (software
+# overwrite) only meets Clear. TRIM/discard is never a sanitization method.
+_PURGE_METHODS = frozenset({
+    "NVMe Sanitize (Cryptographic Erase)",
+    "NVMe Format (Cryptographic Erase)",
+    "NVMe Format (User Data Erase)",
+    "ATA Enhanced Secure Erase",
+    "ATA Secure Erase",
+})
+# Whole-disk kernel names, matched against the device path's basename
+_NVME_NAME_RE = re.compile(r"nvme\d+n\d+")
+_SATA_NAME_RE = re.compile(r"sd[a-z]+")
+# Command output is read in large chunks and split on either line ending
+_READ_CHUNK = 64 * 1024
+_LINE_SPLIT_RE = re.compile(rb"\r\n|[\r\n]")
+
+
+def _parse_hdparm_security(output):
+    """
+    Parses the 'Security:' block of 'hdparm -I' output into a capability
+    record. Each state line reads either '<state>' or 'not <state>'.
+    """
+    caps = {"supported": False, "enabled": False, "locked": False,
+            "frozen": False, "enhanced_erase": False, "erase_time": None}
+    in_security = False
+    for raw in output.splitlines():
+        line = " ".join(raw.split())
+        if line.startswith("Security:"):
+            in_security = True
+            continue
+        if not in_security:
+            continue
+        if raw and not raw[0].isspace():
+            break  # Next top-level section
+        if line == "supported":
+            caps["supported"] = True
+        elif line == "supported: enhanced erase":
+            caps["enhanced_erase"] = True
+        elif line in ("enabled", "locked", "frozen"):
+            caps[line] = True
+        elif "SECURITY ERASE UNIT" in line:
+            caps["erase_time"] = line
+    return caps
+
 class WipeThread(QThread):
     """
     A QThread to handle the data wiping process using real command-line tools.
@@ -18,189 +83,364 @@ class WipeThread(QThread):
     progress = Signal(int)
     finished = Signal(bool, str, dict)  # success (bool), message (str), report_data (dict)
 
-    def __init__(self, device_list, passes=1):
+    def __init__(self, device_list, method="nist-clear", max_parallel=4):
         super().__init__()
+        if method not in _OVERWRITE_METHODS:
+            raise ValueError(f"Unknown overwrite method: {method}")
         self.device_list = device_list
-        self.passes = passes # Used for shred fallback
+        self.method = method # Overwrite scheme for the shred fallback
+        self.passes = _OVERWRITE_METHODS[method][1]
+        self.max_parallel = max_parallel # Cap on devices wiped concurrently
+        self.device_progress = {} # Per-device percentage, averaged for the progress bar
+        self._last_percent = -1
         self.is_running = True
         self.start_time = None
         self.end_time = None
+        self._mono_start = None # time.monotonic_ns() bounds for the duration,
+        self._mono_end = None   # immune to wall-clock (NTP) adjustments
         self.methods_used = {} # To track the method used for each device
+        self._rotational = {} # Device path -> rotational flag (None if unknown), from _validate_devices
 
     def run(self):
         """
-        Main thread execution logic. Iterates through devices and calls the
-        appropriate wiping function based on device type.
+        Main thread execution logic. Drives the asynchronous wipe pipeline on
+        an event loop owned by this worker thread.
         """
+        self._mono_start = time.monotonic_ns()
         self.start_time = datetime.utcnow()
-        total_devices = len(self.device_list)
         devices_wiped_successfully = []
         
         try:
-            for i, device in enumerate(self.device_list):
-                if not self.is_running:
-                    raise Exception("Wipe process was cancelled by the user.")
-
-                device_path = device.get('name')
-                if not device_path:
-                    raise Exception("Could not find device path in device data.")
-                
-                # Safety Check: ensure we are dealing with a block device
-                try:
-                    mode = os.stat(device_path).st_mode
-                    if not stat.S_ISBLK(mode):
-                        raise Exception(f"Path {device_path} is not a block device. Halting for safety.")
-                except FileNotFoundError:
-                     raise Exception(f"Device path {device_path} does not exist.")
-
-                # Dispatch to the correct wiping method
-                self._wipe_device(device)
-                
-                # If wipe was successful
-                devices_wiped_successfully.append(device_path)
-                
-                # Update overall progress after each device is done
-                progress_val = int(((i + 1) / total_devices) * 100)
-                self.progress.emit(progress_val)
+            asyncio.run(self._wipe_all(devices_wiped_successfully))
 
+            self._mono_end = time.monotonic_ns()
             self.end_time = datetime.utcnow()
             report = self._generate_report(True, "Wipe completed successfully.", devices_wiped_successfully)
             self.finished.emit(True, "Success", report)
 
         except Exception as e:
+            self._mono_end = time.monotonic_ns()
             self.end_time = datetime.utcnow()
             error_message = f"An error occurred: {e}"
             report = self._generate_report(False, error_message, devices_wiped_successfully)
             self.finished.emit(False, error_message, report)
 
-    def _run_command(self, command):
+    async def _wipe_all(self, devices_wiped_successfully):
+        """
+        Wipes all devices concurrently, at most max_parallel at a time, since
+        each wipe is bound by its own device. Every device runs to completion
+        even if another fails, so no drive is abandoned mid-command; the first
+        failure is re-raised afterwards.
+        """
+        self._validate_devices()
+        semaphore = asyncio.Semaphore(self.max_parallel)
+        self.device_progress = {d.get('name'): 0 for d in self.device_list}
+
+        async def wipe_one(device):
+            async with semaphore:
+                if not self.is_running:
+                    raise Exception("Wipe process was cancelled by the user.")
+
+                device_path = device['name']
+
+                # Dispatch to the correct wiping method
+                await self._wipe_device(device)
+                
+                # If wipe was successful
+                devices_wiped_successfully.append(device_path)
+                self._set_device_progress(device_path, 100)
+
+        results = await asyncio.gather(
+            *(wipe_one(device) for device in self.device_list), return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+    def _validate_devices(self):
         """
-        Helper to run a command, stream its output for real-time
-        logging, and raise a detailed exception on error. This function
-        assumes the parent script is already running with sudo.
+        Checks every device before any wipe starts, so one bad entry fails
+        the batch immediately instead of hours in, and snapshots each
+        device's rotational flag for _wipe_device.
+        """
+        rotational = {}
+        for device in self.device_list:
+            device_path = device.get('name')
+            if not device_path:
+                raise Exception("Could not find device path in device data.")
+
+            # Safety Check: ensure we are dealing with a block device
+            try:
+                mode = os.stat(device_path).st_mode
+            except FileNotFoundError:
+                raise Exception(f"Device path {device_path} does not exist.")
+            if not stat.S_ISBLK(mode):
+                raise Exception(f"Path {device_path} is not a block device. Halting for safety.")
+
+            try:
+                rotational[device_path] = self._is_rotational(device_path)
+            except OSError as e:
+                print(f"Could not read rotational flag for {device_path}: {e}")
+                rotational[device_path] = None
+        self._rotational = rotational
+
+    def _set_device_progress(self, device_path, percent):
+        """Records one device's progress and emits the average across all devices."""
+        self.device_progress[device_path] = percent
+        self._emit_progress(int(sum(self.device_progress.values()) / len(self.device_progress)))
+
+    def _emit_progress(self, percent):
+        """
+        Emits progress across the thread boundary only when the value changed.
+        The percentage is an integer, so this is at most ~100 signals per run;
+        the GUI coalesces bursts on its side.
+        """
+        if percent == self._last_percent:
+            return
+        self._last_percent = percent
+        self.progress.emit(percent)
+
+    async def _run_command(self, command, timeout=None, on_stderr_line=None):
+        """
+        Helper to run a command as an asyncio subprocess, stream its output
+        for real-time logging, and raise a detailed exception on error.
+        stdout and stderr are drained concurrently so a chatty stderr (e.g.
+        'shred -v') cannot fill its pipe and stall the child. If given,
+        on_stderr_line is called with each stderr line as it arrives. Returns
+        the command's stdout with each line's indentation preserved. This function assumes the parent script is
+        already running with sudo.
         """
         print(f"Executing: {' '.join(command)}")
         
-        process = subprocess.Popen(
-            command, # No longer prepending 'sudo' here
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            bufsize=1  # Line-buffered
+        process = await asyncio.create_subprocess_exec(
+            *command, # No longer prepending 'sudo' here
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
         )
+        stdout_lines = []
+        # Only the tail of stderr is kept for the failure message; 'shred -v'
+        # can print thousands of progress lines over a multi-hour run.
+        stderr_lines = deque(maxlen=64)
 
-        # Real-time logging from stdout
-        while True:
-            output = process.stdout.readline()
-            if output == '' and process.poll() is not None:
-                break
-            if output:
-                print(output.strip())
+        async def drain(stream, sink):
+            # Real-time logging: one read per 64 KiB chunk, then split into
+            # lines. Splitting on '\r' as well as '\n' also handles tools
+            # that redraw a progress line in place.
+            pending = b""
+            while True:
+                chunk = await stream.read(_READ_CHUNK)
+                if not chunk:
+                    break
+                buf = pending + chunk
+                # Hold back a trailing '\r': it may be the first half of a
+                # '\r\n' split across two reads
+                carry = b"\r" if buf.endswith(b"\r") else b""
+                *lines, pending = _LINE_SPLIT_RE.split(buf[:len(buf) - len(carry)])
+                pending += carry
+                for raw in lines:
+                    sink(raw.decode(errors="replace"))
+            if pending.endswith(b"\r"):
+                sink(pending[:-1].decode(errors="replace"))
+            elif pending:
+                sink(pending.decode(errors="replace"))
+
+        def log_stdout(line):
+            # Kept verbatim: parsers such as _parse_hdparm_security rely on
+            # indentation to find section boundaries
+            stdout_lines.append(line)
+            text = line.strip()
+            if text:
+                print(text)
+
+        def log_stderr(line):
+            text = line.strip()
+            if not text:
+                return
+            print(text)
+            stderr_lines.append(text)
+            if on_stderr_line is not None:
+                on_stderr_line(text)
 
-        # Wait for the command to finish and check the return code
-        return_code = process.wait()
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(drain(process.stdout, log_stdout), drain(process.stderr, log_stderr)),
+                timeout,
+            )
+            # Wait for the command to finish and check the return code
+            return_code = await process.wait()
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            raise subprocess.TimeoutExpired(command, timeout)
 
         if return_code != 0:
-            # If there was an error, capture stderr
-            stderr_output = process.stderr.read()
+            # If there was an error, report the captured stderr
+            stderr_output = "\n".join(stderr_lines)
             error_message = (
                 f"Command '{' '.join(command)}' failed with exit code {return_code}.\n"
-                f"Error: {stderr_output.strip()}"
+                f"Error: {stderr_output}"
             )
             raise subprocess.CalledProcessError(return_code, command, stderr=error_message)
+        return "\n".join(stdout_lines)
 
 
-    def _wipe_device(self, device):
+    async def _wipe_device(self, device):
         """
         Selects the correct wiping strategy based on the device name and type.
         Hierarchy: NVMe Sanitize > SATA Secure Erase > Shred Overwrite
         """
         device_path = device['name']
+        name = os.path.basename(device_path)
         
-        if 'nvme' in device_path:
+        if _NVME_NAME_RE.fullmatch(name):
             # It's an NVMe drive
             try:
                 print(f"Attempting NVMe Sanitize on {device_path}...")
                 # Using crypto erase (ses=2), which is fast and secure.
-                self._run_command(["nvme", "sanitize", device_path, "-a", "2"])
+                await self._run_command((*_NVME_SANITIZE_CRYPTO, device_path))
                 self.methods_used[device_path] = "NVMe Sanitize (Cryptographic Erase)"
                 return
             except Exception as e:
                 print(f"NVMe Sanitize failed: {e}. Falling back to NVMe Format.")
                 try:
-                    # Fallback to a standard format with secure erase settings
-                    self._run_command(["nvme", "format", device_path, "-s", "1"])
-                    self.methods_used[device_path] = "NVMe Format (User Data Erase)"
+                    # Prefer a cryptographic erase format (ses=2) when the controller supports it,
+                    # otherwise a standard format with user data erase (ses=1)
+                    if await self._nvme_supports_crypto_erase(device_path):
+                        await self._run_command((*_NVME_FORMAT, "-s", "2", device_path))
+                        self.methods_used[device_path] = "NVMe Format (Cryptographic Erase)"
+                    else:
+                        await self._run_command((*_NVME_FORMAT, "-s", "1", device_path))
+                        self.methods_used[device_path] = "NVMe Format (User Data Erase)"
                     return
                 except Exception as e_fmt:
                     raise Exception(f"NVMe Format also failed on {device_path}: {e_fmt}")
 
-        elif 'sd' in device_path:
-            # It's a SATA device (SSD or HDD)
-            try:
-                # Check if drive is rotational (HDD) or not (SSD)
-                rotational_path = f"/sys/block/{os.path.basename(device_path)}/queue/rotational"
-                with open(rotational_path, 'r') as f:
-                    is_hdd = f.read().strip() == '1'
+        elif _SATA_NAME_RE.fullmatch(name):
+            # It's a SATA device (SSD or HDD); an unknown rotational flag is
+            # treated as an HDD
+            is_hdd = self._rotational.get(device_path) is not False
 
-                # For SSDs, strongly prefer Secure Erase. For HDDs, it's an option but shred is also fine.
-                if not is_hdd:
+            # For SSDs, strongly prefer Secure Erase. For HDDs, it's an option but shred is also fine.
+            if not is_hdd:
+                try:
                     print(f"Attempting SATA Secure Erase on SSD {device_path}...")
-                    self._wipe_sata_secure_erase(device_path)
-                    self.methods_used[device_path] = "ATA Secure Erase"
+                    self.methods_used[device_path] = await self._wipe_sata_secure_erase(device_path)
                     return
-            except Exception as e_sec:
-                print(f"SATA Secure Erase failed or was skipped: {e_sec}. Falling back to shred.")
+                except Exception as e_sec:
+                    print(f"SATA Secure Erase failed or was skipped: {e_sec}.")
+
+            discarded = False
+            if not is_hdd:
+                # TRIM does not guarantee the data is erased, so it is only a
+                # preparatory step; the overwrite below is what sanitizes.
+                try:
+                    print(f"Attempting block discard (TRIM) on SSD {device_path}...")
+                    await self._run_command((*_BLKDISCARD, device_path), timeout=300)
+                    discarded = True
+                except Exception as e_discard:
+                    print(f"Block discard failed: {e_discard}.")
             
-            # Fallback for HDDs or if Secure Erase fails
+            # Fallback for HDDs or if the SSD methods fail
             print(f"Using shred (software overwrite) on {device_path}...")
-            self._wipe_with_shred(device_path)
-            self.methods_used[device_path] = f"{self.passes}-Pass Overwrite (shred)"
+            await self._wipe_with_shred(device_path)
+            method = f"{self.passes}-Pass Overwrite (shred)"
+            self.methods_used[device_path] = f"Block Discard (TRIM) + {method}" if discarded else method
             return
             
         raise Exception(f"Unsupported device type for {device_path}")
 
 
-    def _wipe_sata_secure_erase(self, device_path):
+    async def _wipe_sata_secure_erase(self, device_path):
         """
-        Performs an ATA Secure Erase on a SATA device.
+        Performs an ATA Secure Erase on a SATA device and returns the name of
+        the erase method that succeeded.
         NOTE: This is a complex operation. Drives are often in a 'frozen' state
-        which prevents this from working without a power cycle. This implementation
-        assumes the drive is not frozen.
+        which prevents this from working without a power cycle; such drives,
+        and drives that already have a password set or are locked, are
+        rejected up front so the caller can fall back immediately.
         """
         password = "p"
-        # 1. Check if security is supported and not enabled.
-        # This is a simplified check. A full one would parse `hdparm -I` output.
+        # 1. Check if security is supported and the drive is in a usable state.
+        caps = await self._hdparm_security(device_path)
+        if not caps["supported"]:
+            raise Exception(f"ATA security feature set not supported on {device_path}")
+        if caps["frozen"]:
+            raise Exception(f"{device_path} is security-frozen; a power cycle or suspend/resume is required")
+        if caps["locked"]:
+            raise Exception(f"{device_path} is security-locked; it must be unlocked with its current password first")
+        if caps["enabled"]:
+            raise Exception(f"{device_path} already has an ATA user password set")
+        if caps["erase_time"]:
+            print(f"Drive estimate: {caps['erase_time']}")
         
         # 2. Set a temporary password.
-        self._run_command(["hdparm", "--user-master", "user", "--security-set-pass", password, device_path])
+        await self._run_command((*_HDPARM_USER, "--security-set-pass", password, device_path))
 
-        # 3. Issue the erase command.
-        # --security-erase is for standard erase. --security-erase-enhanced is better if supported.
+        # 3. Issue the erase command. Enhanced erase also covers reallocated
+        # sectors, so use it when the drive supports it, else the standard erase.
+        # No timeout: hdparm only returns once the erase (possibly hours) is done.
+        erase_options = [("--security-erase", "ATA Secure Erase")]
+        if caps["enhanced_erase"]:
+            erase_options.insert(0, ("--security-erase-enhanced", "ATA Enhanced Secure Erase"))
         try:
-            self._run_command(["hdparm", "--user-master", "user", "--security-erase", password, device_path])
-        except subprocess.TimeoutExpired:
-            # Secure erase commands often don't return until done, which can take hours.
-            # For the purpose of this app, we assume it has started successfully.
-            # A more robust solution would monitor the drive's state.
-            print("Secure Erase command sent. Assuming it is in progress.")
+            for erase_flag, method in erase_options:
+                try:
+                    await self._run_command((*_HDPARM_USER, erase_flag, password, device_path))
+                    return method
+                except subprocess.CalledProcessError as e:
+                    print(f"hdparm {erase_flag} failed: {e.stderr}")
+                    last_error = e
+            raise last_error
         except Exception as e:
             # If it fails, try to disable security so the drive isn't locked.
-            self._run_command(["hdparm", "--user-master", "user", "--security-disable", password, device_path])
+            await self._run_command((*_HDPARM_USER, "--security-disable", password, device_path))
             raise e
 
-    def _wipe_with_shred(self, device_path):
+    async def _hdparm_security(self, device_path):
+        """Returns the drive's ATA security capabilities as reported by 'hdparm -I'."""
+        output = await self._run_command((*_HDPARM_IDENTIFY, device_path))
+        return _parse_hdparm_security(output)
+
+    def _is_rotational(self, device_path):
+        """Reads the kernel's rotational flag: True for spinning disks, False for SSDs."""
+        rotational_path = f"/sys/block/{os.path.basename(device_path)}/queue/rotational"
+        with open(rotational_path, 'r') as f:
+            return f.read().strip() == '1'
+
+    async def _nvme_supports_crypto_erase(self, device_path):
+        """Checks the Format NVM Attributes (FNA) bit 2 reported by 'nvme id-ctrl'."""
+        try:
+            output = await self._run_command((*_NVME_ID_CTRL, device_path))
+            return bool(json.loads(output).get("fna", 0) & 0x4)
+        except Exception as e:
+            print(f"Could not query NVMe crypto erase support: {e}")
+            return False
+
+    async def _wipe_with_shred(self, device_path):
         """
         Wipes a device using the 'shred' command, forced into line-buffering
         mode with 'stdbuf' to ensure real-time progress output is visible.
         """
-        # -n 2: 2 passes of random data
         # -v: verbose, show progress
-        # -z: final pass of zeros to hide shredding
-        #
-        # 'stdbuf -oL' forces the command's standard output to be line-buffered.
-        command = ["stdbuf", "-oL", "shred", "-n", "2", "-v", "-z", device_path]
-        self._run_command(command)
+        # -n N: N passes of random data; -z: final pass of zeros to hide shredding
+        pass_args, _ = _OVERWRITE_METHODS[self.method]
+        command = (*_SHRED_CMD, *pass_args, device_path)
+        last_percent = -1
+
+        def on_progress(line):
+            # Map "pass N/M ... P%" onto 0-100 for the whole shred run
+            nonlocal last_percent
+            match = _SHRED_PROGRESS_RE.search(line)
+            if not match:
+                return
+            pass_num, pass_total = int(match.group(1)), int(match.group(2))
+            pass_percent = int(match.group(3) or 0)
+            percent = int(((pass_num - 1) + pass_percent / 100) / pass_total * 100)
+            if percent != last_percent:
+                last_percent = percent
+                self._set_device_progress(device_path, percent)
+
+        await self._run_command(command, on_stderr_line=on_progress)
         
     def _generate_report(self, success, message, wiped_devices):
         """Generates a dictionary with wipe results."""
@@ -211,8 +451,11 @@ class WipeThread(QThread):
             "message": message,
             "start_time_utc": self.start_time.isoformat() + "Z",
             "end_time_utc": self.end_time.isoformat() + "Z" if self.end_time else "N/A",
-            "duration_seconds": (self.end_time - self.start_time).total_seconds() if self.end_time else 0,
+            "duration_seconds": (self._mono_end - self._mono_start) / 1e9 if self._mono_end else 0,
             "methods_used": self.methods_used,
+            # NIST SP 800-88 category actually achieved per device
+            "method_types": {path: "Purge" if method in _PURGE_METHODS else "Clear"
+                             for path, method in self.methods_used.items()},
         }
 
     def stop(self):